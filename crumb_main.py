@@ -18,6 +18,13 @@ import threading
 import RPi.GPIO as GPIO
 from RPLCD.i2c import CharLCD
 
+# System beeps are Windows-only. Import once here: a failed import is not
+# cached, so importing per button press re-scans sys.path every time on the Pi
+try:
+    import winsound
+except ImportError:
+    winsound = None
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # initialize pins/display
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -37,8 +44,11 @@ RGB_COMMON = 17
 ROW_PINS = [5, 6, 13, 19]
 COL_PINS = [26, 16, 21, 12]
 
+# pre_init must come before init or its settings are ignored. Linux/ALSA
+# underruns with small buffers, so use 1024 samples there
+MIXER_BUFFER = 1024 if sys.platform.startswith('linux') else 512
+pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=MIXER_BUFFER)
 pygame.mixer.init()
-pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=1024)
 
 BUTTON_MAP = [
     ['1', '2', '3', 'A'],
@@ -126,11 +136,10 @@ def create_mystical_startup_beep():
         
         for freq in mystical_frequencies:
             # Use system beep if available
-            try:
-                import winsound
+            if winsound:
                 winsound.Beep(freq, 400)  # 400ms each note
                 time.sleep(0.1)  # Small gap between notes
-            except ImportError:
+            else:
                 # Fallback for systems without winsound
                 print(f"♪ Mystical tone: {freq}Hz")
                 time.sleep(0.5)
@@ -194,10 +203,9 @@ def button_press_sound(button_type="normal"):
         "special": 1200   # Special actions
     }
     
-    try:
-        import winsound
+    if winsound:
         winsound.Beep(frequencies[button_type], 80)  # Short beep
-    except ImportError:
+    else:
         # Fallback for systems without winsound (like Raspberry Pi)
         print(f"♪ {button_type} click")
 
@@ -901,14 +909,10 @@ def quick_sound_test():
         set_sacred_color("water")
         
         # Play system beep or test tone
-        try:
-            import pygame
-            pygame.mixer.init()
-            # Generate a simple test tone or use system beep
-            import winsound
+        if winsound:
             winsound.Beep(440, 500)  # 440Hz for 500ms
-        except ImportError:
-            # Fallback for systems without pygame/winsound
+        else:
+            # Fallback for systems without winsound
             print("\a")  # System bell
         
         sacred_pause(1)
@@ -925,7 +929,6 @@ def quick_sound_test():
         set_sacred_color("mystery")
         
         try:
-            import pygame
             pygame.mixer.init()
             
             # Path to your downloaded file (adjust as needed)
@@ -1053,15 +1056,13 @@ def play_audio_clip(clip_info):
     set_sacred_color(clip_info['color'])
     
     try:
-        import pygame
         pygame.mixer.init()
         
         # Handle special system sounds
         if clip_info['file'] == "system_beep":
-            try:
-                import winsound
+            if winsound:
                 winsound.Beep(440, 500)
-            except ImportError:
+            else:
                 print("\a")  # System bell fallback
         else:
             # Load and play the audio file
@@ -1316,7 +1317,7 @@ def sacred_cleanup():
             lcd.clear()
         GPIO.cleanup()
         print("🌙 Sacred cleanup complete")
-    except:
+    except Exception:
         pass
     sys.exit(0)
 
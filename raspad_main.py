@@ -7,13 +7,56 @@ Designed with sacred intention and mystical beauty
 
 import tkinter as tk
 from tkinter import font
+import functools
+import logging
+from logging.handlers import RotatingFileHandler
 import sys
-import traceback
-import pygame
 import os
-from datetime import datetime
+
+log = logging.getLogger("crumb")
+LOG_FILE = "/tmp/crumb.log"
+
+# Sacred color palette
+SACRED_COLORS = {
+    'void': '#0f0f23',
+    'deep': '#1a1a2e', 
+    'mystic': '#16213e',
+    'ethereal': '#e94560',
+    'gold': '#f3a712',
+    'sage': '#53a8b6',
+    'earth': '#8b5a3c',
+    'fire': '#ff6b35',
+    'water': '#4ecdc4',
+    'air': '#95e1d3',
+    'aether': '#c44569'
+}
+
+def _hex_to_rgb(hex_color):
+    """Split '#rrggbb' into an (r, g, b) tuple of ints"""
+    value = int(hex_color.lstrip('#'), 16)
+    return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
+
+# Palette as (r, g, b) ints, parsed once at import
+_PALETTE_RGB = {name: _hex_to_rgb(hex_color) for name, hex_color in SACRED_COLORS.items()}
 
 class CrumbUI:
+    # Size of the top-left exit gesture zone in pixels
+    EXIT_CORNER_SIZE = 100
+
+    # Emoji-capable families in order of preference (monochrome only -
+    # Tk 8.6 on X11 cannot draw color bitmap fonts like Noto Color Emoji)
+    EMOJI_FONT_FAMILIES = ("Symbola", "Noto Emoji", "DejaVu Sans", "Arial")
+
+    # Hub animations share one timer
+    ANIMATION_TICK_MS = 1200
+
+    __slots__ = (
+        'root', 'colors', 'active_colors', 'fonts', 'emoji_family',
+        'audio_enabled', 'main_frame', 'screens', 'screen_factories',
+        'current_screen', 'visible_screen', 'companion', 'sparkles',
+        'exit_taps', 'animation_running', 'animation_frame', 'after_ids',
+    )
+
     def __init__(self):
         try:
             # Initialize the sacred vessel
@@ -21,85 +64,110 @@ class CrumbUI:
             self.root.title("✧ Crumb ✧")
             self.root.configure(bg='#1a1a2e')
             
-            # Configure for RasPad touchscreen
-            self.root.geometry("1024x600")
-            self.root.attributes('-fullscreen', True)
+            # Build the widget tree unmapped so it is laid out once
+            self.root.withdraw()
             
             # Sacred color palette
-            self.colors = {
-                'void': '#0f0f23',
-                'deep': '#1a1a2e', 
-                'mystic': '#16213e',
-                'ethereal': '#e94560',
-                'gold': '#f3a712',
-                'sage': '#53a8b6',
-                'earth': '#8b5a3c',
-                'fire': '#ff6b35',
-                'water': '#4ecdc4',
-                'air': '#95e1d3',
-                'aether': '#c44569'
-            }
+            self.colors = SACRED_COLORS
+            self.active_colors = {name: self.lighten_color(name) for name in self.colors}
             
             # Initialize state
             self.current_screen = "hub"
+            self.visible_screen = None
             self.exit_taps = 0
             self.animation_running = False
+            self.after_ids = {}  # Pending after() ids by name, see schedule()
+            self.animation_frame = 0
             
             # Setup systems
             self.setup_fonts()
-            self.setup_audio()
+            self.setup_styles()
+            self.audio_enabled = None  # Mixer is initialized on first playback
             
             # Create main container
             self.main_frame = tk.Frame(self.root, bg=self.colors['deep'])
             self.main_frame.pack(fill='both', expand=True)
             
-            # Create screens
+            # Create screens - only the hub is built up front, the rest
+            # are built on first visit
             self.screens = {}
+            self.screen_factories = {}
             self.create_hub_screen()
             self.create_placeholder_screens()
             
             # Start hub
             self.show_screen('hub')
+            self.reveal_window()
             
-            # Play startup music
-            self.play_startup_music()
+            # Build the other screens one at a time in idle time after startup
+            self.root.after_idle(self.prebuild_next_screen)
+            
+            # Start the startup music from idle time rather than inline in __init__
+            self.root.after_idle(self.play_startup_music)
             
             # Setup interactions
             self.root.bind('<Button-1>', self.handle_click)
+            self.root.report_callback_exception = self.report_callback_exception
             
-            # Start animations
-            self.start_animations()
-            
-            print("✧ Crumb UI v0.2 initialized successfully ✧")
+            log.info("✧ Crumb UI v0.2 initialized successfully ✧")
             
         except Exception as e:
             self.handle_error("Initialization", e)
+            if hasattr(self, 'root'):
+                self.reveal_window()
+
+    def reveal_window(self):
+        """Configure for RasPad touchscreen and map the finished window"""
+        try:
+            self.root.geometry("1024x600")
+            self.root.attributes('-fullscreen', True)
+            self.root.deiconify()
+        except Exception as e:
+            log.warning("Window setup error: %s", e)
 
     def setup_fonts(self):
         """Initialize sacred typography"""
+        # Resolve an emoji-capable family once so symbol glyphs don't go
+        # through Tk's font fallback on every redraw
         try:
-            self.fonts = {
-                'title': font.Font(family="Arial", size=28, weight="bold"),
-                'subtitle': font.Font(family="Arial", size=14),
-                'body': font.Font(family="Arial", size=12),
-                'button': font.Font(family="Arial", size=16, weight="bold"),
-                'large_symbol': font.Font(family="Arial", size=32, weight="bold"),
-                'companion': font.Font(family="Arial", size=24)
-            }
+            available = set(font.families(self.root))
         except Exception as e:
-            print(f"Font setup warning: {e}")
-            # Fallback fonts
-            self.fonts = {
-                'title': ('Arial', 28, 'bold'),
-                'subtitle': ('Arial', 14),
-                'body': ('Arial', 12),
-                'button': ('Arial', 16, 'bold'),
-                'large_symbol': ('Arial', 32, 'bold'),
-                'companion': ('Arial', 24)
-            }
-
-    def setup_audio(self):
-        """Initialize audio system"""
+            log.warning("Font setup warning: %s", e)
+            available = set()
+        self.emoji_family = next(
+            (family for family in self.EMOJI_FONT_FAMILIES if family in available),
+            'Arial')
+        
+        # Tuple specs avoid creating named Tk fonts up front
+        self.fonts = {
+            'title': ('Arial', 28, 'bold'),
+            'subtitle': ('Arial', 14),
+            'body': ('Arial', 12),
+            'button': ('Arial', 16, 'bold'),
+            'large_symbol': (self.emoji_family, 32, 'bold'),
+            'companion': (self.emoji_family, 24)
+        }
+
+    def setup_styles(self):
+        """Register shared widget defaults once in the Tk option database"""
+        self.root.option_add('*Button.borderWidth', 0)
+        self.root.option_add('*Button.relief', 'flat')
+
+    def ensure_audio(self):
+        """Initialize audio system on first use"""
+        if self.audio_enabled is not None:
+            return self.audio_enabled
+        if os.environ.get('CRUMB_NO_AUDIO'):
+            self.audio_enabled = False
+            log.info("✧ Audio disabled by CRUMB_NO_AUDIO ✧")
+            return self.audio_enabled
+        try:
+            # Imported here so startup doesn't pay for loading SDL
+            import pygame
+        except ImportError as e:
+            self.audio_enabled = False
+            log.warning("✧ Audio disabled, pygame unavailable: %s ✧", e)
+            return self.audio_enabled
         try:
             # Try USB speaker first
             os.environ['SDL_AUDIODRIVER'] = 'alsa'
@@ -108,30 +176,30 @@ class CrumbUI:
             pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=1024)
             pygame.mixer.init()
             self.audio_enabled = True
-            print("✧ Audio system initialized ✧")
+            log.info("✧ Audio system initialized ✧")
         except Exception as e:
-            print(f"Audio initialization error: {e}")
+            log.warning("Audio initialization error: %s", e)
             try:
                 pygame.mixer.init()
                 self.audio_enabled = True
-                print("✧ Audio system initialized with default device ✧")
-            except:
+                log.info("✧ Audio system initialized with default device ✧")
+            except Exception:
                 self.audio_enabled = False
-                print("✧ Audio disabled ✧")
+                log.warning("✧ Audio disabled ✧")
+        return self.audio_enabled
 
     def play_startup_music(self):
         """Play continuous background music"""
-        if not self.audio_enabled:
-            return
         try:
             startup_file = "/home/pi/Downloads/startup.mp3"
-            if os.path.exists(startup_file):
+            if os.path.exists(startup_file) and self.ensure_audio():
+                import pygame
                 pygame.mixer.music.load(startup_file)
                 pygame.mixer.music.set_volume(0.4)
                 pygame.mixer.music.play(-1)  # Loop forever
-                print("✧ Startup music playing ✧")
+                log.info("✧ Startup music playing ✧")
         except Exception as e:
-            print(f"Music error: {e}")
+            log.warning("Music error: %s", e)
 
     def create_hub_screen(self):
         """🏠 The Sacred Hub - Enhanced with magic"""
@@ -199,35 +267,36 @@ class CrumbUI:
         
         # Sacred navigation buttons in 2x2 grid
         buttons = [
-            ("🌍", "Elements", self.colors['earth'], 'elemental'),
-            ("🎵", "Sounds", self.colors['ethereal'], 'soundboard'),
-            ("🧙‍♂️", "Archetypes", self.colors['aether'], 'archetype'),
-            ("⚙️", "Settings", self.colors['mystic'], 'settings')
+            ("🌍", "Elements", 'earth', 'elemental'),
+            ("🎵", "Sounds", 'ethereal', 'soundboard'),
+            ("🧙‍♂️", "Archetypes", 'aether', 'archetype'),
+            ("⚙️", "Settings", 'mystic', 'settings')
         ]
         
+        columns = 2
+        rows = (len(buttons) + columns - 1) // columns
+        
+        # Configure grid weights once per row/column for responsive layout
+        for row in range(rows):
+            nav_frame.grid_rowconfigure(row, weight=1)
+        for col in range(columns):
+            nav_frame.grid_columnconfigure(col, weight=1)
+        
         for i, (symbol, label, color, screen) in enumerate(buttons):
-            row, col = i // 2, i % 2
+            row, col = divmod(i, columns)
             
             btn = tk.Button(nav_frame,
                            text=f"{symbol}\n{label}",
                            font=self.fonts['button'],
                            fg='white',
-                           bg=color,
-                           activebackground=self.lighten_color(color),
+                           bg=self.colors[color],
+                           activebackground=self.active_colors[color],
                            activeforeground='white',
-                           bd=0,
-                           relief='flat',
                            width=9,
                            height=3,
-                           command=lambda s=screen: self.safe_navigate(s))
+                           command=functools.partial(self.safe_navigate, screen))
             btn.grid(row=row, column=col, padx=15, pady=15, sticky='nsew')
         
-        # Configure grid weights for responsive layout
-        nav_frame.grid_rowconfigure(0, weight=1)
-        nav_frame.grid_rowconfigure(1, weight=1)
-        nav_frame.grid_columnconfigure(0, weight=1)
-        nav_frame.grid_columnconfigure(1, weight=1)
-        
         # Sparkle background elements
         self.create_sparkles(hub)
         
@@ -248,10 +317,10 @@ class CrumbUI:
                 sparkle.place(x=x, y=y)
                 self.sparkles.append(sparkle)
         except Exception as e:
-            print(f"Sparkle creation error: {e}")
+            log.warning("Sparkle creation error: %s", e)
 
     def create_placeholder_screens(self):
-        """Create simplified placeholder screens"""
+        """Register simplified placeholder screens for lazy creation"""
         screens_config = [
             ('elemental', "✧ Elemental Modes ✧", "🌱", "Sacred elemental forces await..."),
             ('soundboard', "✧ Sacred Sounds ✧", "🎵", "Expression tools in development..."),
@@ -260,10 +329,25 @@ class CrumbUI:
         ]
         
         for screen_name, title, symbol, message in screens_config:
+            self.screen_factories[screen_name] = functools.partial(
+                self.create_placeholder_screen, screen_name, title, symbol, message)
+
+    def prebuild_next_screen(self):
+        """Build one pending screen, then yield to the event loop"""
+        if not self.screen_factories:
+            return
+        self.get_screen(next(iter(self.screen_factories)))
+        if self.screen_factories:
+            self.root.after_idle(self.prebuild_next_screen)
+
+    def get_screen(self, screen_name):
+        """Return a screen, building it on first visit"""
+        if screen_name not in self.screens and screen_name in self.screen_factories:
             try:
-                self.create_placeholder_screen(screen_name, title, symbol, message)
+                self.screen_factories.pop(screen_name)()
             except Exception as e:
-                print(f"Error creating {screen_name}: {e}")
+                log.warning("Error creating %s: %s", screen_name, e)
+        return self.screens.get(screen_name)
 
     def create_placeholder_screen(self, name, title, symbol, message):
         """Create a clean placeholder screen"""
@@ -279,11 +363,10 @@ class CrumbUI:
                             font=self.fonts['body'],
                             fg=self.colors['sage'],
                             bg=self.colors['deep'],
-                            activebackground=self.lighten_color(self.colors['deep']),
-                            bd=0,
+                            activebackground=self.active_colors['deep'],
                             padx=20,
                             pady=10,
-                            command=lambda: self.safe_navigate('hub'))
+                            command=functools.partial(self.safe_navigate, 'hub'))
         back_btn.pack(side='left', padx=30)
         
         # Title
@@ -317,169 +400,208 @@ class CrumbUI:
         
         self.screens[name] = screen
 
+    def schedule(self, name, delay_ms, callback):
+        """Schedule a named after() callback, replacing any pending one"""
+        self.cancel_scheduled(name)
+        self.after_ids[name] = self.root.after(delay_ms, self.run_scheduled, name, callback)
+
+    def run_scheduled(self, name, callback):
+        """Forget a fired timer's id, then run its callback"""
+        self.after_ids.pop(name, None)
+        callback()
+
+    def cancel_scheduled(self, name):
+        """Cancel a named after() callback if it is pending"""
+        after_id = self.after_ids.pop(name, None)
+        if after_id is not None:
+            self.root.after_cancel(after_id)
+
     def start_animations(self):
         """Start lightweight animations"""
         if self.animation_running:
             return
         self.animation_running = True
+        self.animation_frame = 0
+        self.animation_tick()
+
+    def stop_animations(self):
+        """Stop animations and cancel the pending tick"""
+        self.animation_running = False
+        self.cancel_scheduled('animation')
+
+    def animation_tick(self):
+        """Drive every hub animation from a single timer"""
+        # Only True while the hub is visible (see show_screen)
+        if not self.animation_running:
+            return
         self.animate_companion()
         self.animate_sparkles()
+        self.animation_frame += 1
+        self.schedule('animation', self.ANIMATION_TICK_MS, self.animation_tick)
 
     def animate_companion(self):
         """Animate the floating companion"""
         try:
-            if hasattr(self, 'companion') and self.current_screen == 'hub':
-                # Cycle through companion states
-                companions = ["🌟", "✨", "💫", "⭐"]
-                current_index = getattr(self, 'companion_index', 0)
-                
-                self.companion.config(text=companions[current_index])
-                self.companion_index = (current_index + 1) % len(companions)
-            
-            # Continue animation
-            self.root.after(1200, self.animate_companion)
+            # Cycle through companion states
+            companions = ["🌟", "✨", "💫", "⭐"]
+            self.companion.config(text=companions[self.animation_frame % len(companions)])
             
         except Exception as e:
-            print(f"Companion animation error: {e}")
-            self.root.after(2000, self.animate_companion)
+            log.warning("Companion animation error: %s", e)
 
     def animate_sparkles(self):
         """Animate background sparkles"""
         try:
-            if hasattr(self, 'sparkles') and self.current_screen == 'hub':
-                # Cycle sparkle opacity/visibility
-                sparkle_states = ["✦", "✧", "✦", " "]
-                current_state = getattr(self, 'sparkle_state', 0)
-                
-                for i, sparkle in enumerate(self.sparkles):
-                    # Stagger sparkle animation
-                    state_index = (current_state + i) % len(sparkle_states)
-                    sparkle.config(text=sparkle_states[state_index])
-                
-                self.sparkle_state = (current_state + 1) % len(sparkle_states)
+            # Cycle sparkle opacity/visibility
+            sparkle_states = ["✦", "✧", "✦", " "]
             
-            # Continue animation
-            self.root.after(1500, self.animate_sparkles)
+            for i, sparkle in enumerate(self.sparkles):
+                # Stagger sparkle animation
+                state_index = (self.animation_frame + i) % len(sparkle_states)
+                sparkle.config(text=sparkle_states[state_index])
             
         except Exception as e:
-            print(f"Sparkle animation error: {e}")
-            self.root.after(3000, self.animate_sparkles)
+            log.warning("Sparkle animation error: %s", e)
 
     def safe_navigate(self, screen_name):
         """Navigate with full error protection"""
         try:
-            if screen_name in self.screens:
-                self.show_screen(screen_name)
-                print(f"✧ Navigated to {screen_name} ✧")
+            # show_screen falls back to the hub if the screen is unknown or fails to build
+            self.show_screen(screen_name)
+            if self.current_screen == screen_name:
+                log.info("✧ Navigated to %s ✧", screen_name)
             else:
-                print(f"Screen {screen_name} not found, returning to hub")
-                self.show_screen('hub')
+                log.warning("Screen %s not found, returning to hub", screen_name)
         except Exception as e:
-            print(f"Navigation error: {e}")
+            log.warning("Navigation error: %s", e)
             self.show_screen('hub')
 
     def show_screen(self, screen_name):
         """Switch between screens safely"""
         try:
-            # Hide all screens
-            for screen in self.screens.values():
-                screen.pack_forget()
+            screen = self.get_screen(screen_name)
+            if screen is None:
+                # Fallback to hub
+                screen_name, screen = 'hub', self.screens['hub']
             
-            # Show target screen
-            if screen_name in self.screens:
-                self.screens[screen_name].pack(fill='both', expand=True)
-                self.current_screen = screen_name
+            # Hide only the screen currently on display
+            if self.visible_screen is not None and self.visible_screen is not screen:
+                self.visible_screen.place_forget()
+            
+            # Show target screen - place avoids a full pack re-layout per switch
+            screen.place(x=0, y=0, relwidth=1, relheight=1)
+            self.visible_screen = screen
+            self.current_screen = screen_name
+            
+            # Only keep animation timers armed while the hub is visible
+            if self.current_screen == 'hub':
+                self.start_animations()
             else:
-                # Fallback to hub
-                self.screens['hub'].pack(fill='both', expand=True)
-                self.current_screen = 'hub'
+                self.stop_animations()
                 
         except Exception as e:
-            print(f"Screen display error: {e}")
+            log.warning("Screen display error: %s", e)
 
     def handle_click(self, event):
         """Handle all click events including exit gesture"""
+        # Bound on the root, so this fires for every widget with event.x/y
+        # relative to that widget - test screen coordinates instead (the
+        # window is fullscreen). Fast path: most clicks are nowhere near the corner
+        if event.x_root >= self.EXIT_CORNER_SIZE or event.y_root >= self.EXIT_CORNER_SIZE:
+            return
+        # Taps on a button in the corner (e.g. "← Back to Hub") are navigation
+        if isinstance(event.widget, tk.Button):
+            return
         try:
             # Exit gesture: triple-tap top-left corner
-            if event.x < 100 and event.y < 100:
-                self.exit_taps += 1
-                print(f"Exit tap {self.exit_taps}/3")
-                if self.exit_taps >= 3:
-                    self.graceful_exit()
-                # Reset counter after 3 seconds
-                self.root.after(3000, self.reset_exit_counter)
-                
+            self.exit_taps += 1
+            log.info("Exit tap %d/3", self.exit_taps)
+            if self.exit_taps >= 3:
+                self.graceful_exit()
+            # Reset counter 3 seconds after the latest tap
+            self.schedule('exit_reset', 3000, self.reset_exit_counter)
         except Exception as e:
-            print(f"Click handler error: {e}")
+            log.warning("Click handler error: %s", e)
 
     def reset_exit_counter(self):
         """Reset exit gesture counter"""
         self.exit_taps = 0
 
-    def lighten_color(self, hex_color):
-        """Create lighter version of color for hover effects"""
-        try:
-            hex_color = hex_color.lstrip('#')
-            rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-            lighter_rgb = tuple(min(255, int(c * 1.3)) for c in rgb)
-            return f"#{lighter_rgb[0]:02x}{lighter_rgb[1]:02x}{lighter_rgb[2]:02x}"
-        except:
-            return hex_color
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def lighten_color(color_name):
+        """Create lighter version of a palette color for hover effects (cached per color)"""
+        r, g, b = _PALETTE_RGB[color_name]
+        return "#%02x%02x%02x" % (min(255, int(r * 1.3)), min(255, int(g * 1.3)), min(255, int(b * 1.3)))
 
     def handle_error(self, context, error):
         """Universal error handler"""
-        error_msg = f"Error in {context}: {str(error)}"
-        print(f"🚨 {error_msg}")
-        print(f"Traceback: {traceback.format_exc()}")
+        log.error("🚨 Error in %s: %s", context, error)
+        # Only walk and format the stack when debug logging is enabled
+        log.debug("Traceback for %s", context, exc_info=True)
+
+    def report_callback_exception(self, exc_type, exc_value, exc_traceback):
+        """Report Tk callback errors without leaving the main loop"""
+        # Unexpected, so always keep the stack (Tk's default handler printed it)
+        log.error("🚨 Error in Callback: %s", exc_value,
+                  exc_info=(exc_type, exc_value, exc_traceback))
 
     def graceful_exit(self):
         """Exit the application gracefully"""
         try:
-            print("✧ Sacred journey ending gracefully ✧")
-            self.animation_running = False
-            if self.audio_enabled:
-                pygame.mixer.quit()
+            log.info("✧ Sacred journey ending gracefully ✧")
+            self.stop_animations()
+            # The mixer is left running: pygame's exit hook closes it once,
+            # on the main thread, when the process ends
             self.root.quit()
-        except:
-            print("✧ Force closing ✧")
+        except Exception:
+            log.warning("✧ Force closing ✧")
             sys.exit(0)
 
     def run(self):
         """Start the sacred interface"""
         try:
-            print("✧ Crumb UI v0.2 - Minimal Sacred Interface Starting ✧")
-            print("Triple-tap top-left corner to exit")
+            log.info("✧ Crumb UI v0.2 - Minimal Sacred Interface Starting ✧")
+            log.info("Triple-tap top-left corner to exit")
             
-            # Start main loop with error recovery
-            while True:
-                try:
-                    self.root.mainloop()
-                    break  # Normal exit
-                except Exception as e:
-                    self.handle_error("Main Loop", e)
-                    # Try to recover
-                    try:
-                        self.root.update()
-                    except:
-                        break
-                        
+            # Callback errors are reported by report_callback_exception,
+            # so mainloop only returns on exit
+            self.root.mainloop()
         except KeyboardInterrupt:
-            print("\n✧ Sacred journey interrupted ✧")
+            log.info("✧ Sacred journey interrupted ✧")
         except Exception as e:
             self.handle_error("Application", e)
         finally:
-            print("✧ Crumb UI session ended ✧")
+            log.info("✧ Crumb UI session ended ✧")
+
+
+def setup_logging():
+    """Log to the console and a small rotating file"""
+    handlers = [logging.StreamHandler(sys.stdout)]
+    file_error = None
+    try:
+        handlers.append(RotatingFileHandler(LOG_FILE, maxBytes=1 << 20, backupCount=2,
+                                            encoding="utf-8"))
+    except OSError as e:
+        # e.g. left owned by root after a sudo run - never block startup on it
+        file_error = e
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(message)s",
+        handlers=handlers)
+    if file_error is not None:
+        log.warning("File log %s disabled: %s", LOG_FILE, file_error)
 
 
 def main():
     """Initialize and run Crumb with maximum reliability"""
+    setup_logging()
     try:
         app = CrumbUI() 
         app.run()
     except Exception as e:
-        print(f"Fatal error: {e}")
-        print(f"Traceback: {traceback.format_exc()}")
-        print("✧ Application terminated ✧")
+        log.exception("Fatal error: %s", e)
+        log.info("✧ Application terminated ✧")
 
 
 if __name__ == "__main__":